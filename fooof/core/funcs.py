@@ -30,13 +30,10 @@ def gaussian_function(xs, *params):
         Output values for gaussian function.
     """
 
-    ys = np.zeros_like(xs)
-
-    for ii in range(0, len(params), 3):
-
-        ctr, hgt, wid = params[ii:ii+3]
+    # Split parameters into separate arrays of centers, heights & widths, one value per peak
+    ctrs, hgts, wids = np.reshape(np.asarray(params, dtype=float), [-1, 3]).T
 
-        ys = ys + hgt * np.exp(-(xs-ctr)**2 / (2*wid**2))
+    ys = _sum_gaussians(xs, ctrs, hgts, wids)
 
     return ys
 
@@ -92,7 +89,9 @@ def expo_nk_function(xs, *params):
 
     offset, exp = params
 
-    ys = ys + offset - np.log10(xs**exp)
+    # Note: this is computed as exp * log10(xs), which is equivalent to log10(xs**exp)
+    #   This means the log is computed only for xs, which is shared if params are arrays
+    ys = ys + offset - exp * np.log10(xs)
 
     return ys
 
@@ -232,3 +231,34 @@ def infer_ap_func(aperiodic_params):
                                     "inconsistent with available options.")
 
     return aperiodic_mode
+
+###################################################################################################
+###################################################################################################
+
+def _sum_gaussians(xs, ctrs, hgts, wids):
+    """Evaluate a set of gaussians, and sum across them.
+
+    Parameters
+    ----------
+    xs : 1d array
+        Input x-axis values.
+    ctrs, hgts, wids : ndarray
+        Centers, heights and widths of the gaussians, with the last dimension across gaussians.
+        Any leading dimensions, for example across spectra, are kept in the output.
+
+    Returns
+    -------
+    ys : ndarray
+        Summed gaussian values, with shape of [..., n_xs].
+    """
+
+    # Evaluate all gaussians together, as [..., n_gaussians, n_xs], and then sum across them
+    #   After the first step, each step is computed in place, reusing the same array
+    zs = (xs - ctrs[..., None]) * (1 / wids)[..., None]
+    np.multiply(zs, zs, out=zs)
+    np.multiply(zs, -0.5, out=zs)
+    np.exp(zs, out=zs)
+    np.multiply(zs, hgts[..., None], out=zs)
+    ys = np.sum(zs, axis=-2)
+
+    return ys
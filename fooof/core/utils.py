@@ -33,6 +33,33 @@ def group_three(vec):
     return [list(vec[ii:ii+3]) for ii in range(0, len(vec), 3)]
 
 
+def group_peak_params(params):
+    """Group peak parameters into an array, with one row per peak.
+
+    Parameters
+    ----------
+    params : list of float or list of list of float
+        Peak parameters, as a flat list, or as a list of lists with three items each.
+
+    Returns
+    -------
+    2d array
+        Array of peak parameters, as [n_peaks, 3].
+
+    Raises
+    ------
+    ValueError
+        If input data cannot be evenly grouped into threes.
+    """
+
+    params = np.asarray(params, dtype=float)
+
+    if params.size % 3 != 0:
+        raise ValueError("Wrong size array to group by three.")
+
+    return np.reshape(params, [-1, 3])
+
+
 def nearest_ind(array, value):
     """Find the nearest index, in an array, to a given value.
 
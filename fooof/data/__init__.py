@@ -1,3 +1,3 @@
 """Data sub-module for FOOOF."""
 
-from .data import FOOOFSettings, FOOOFMetaData, FOOOFResults, SimParams
+from .data import FOOOFSettings, FOOOFMetaData, FOOOFResults, SimParams, GroupSimParams
@@ -6,9 +6,14 @@ Notes on FOOOF data objects:
 - wrapping in objects helps to be able to render well formed documentation for them.
 - setting `__slots__` as empty voids the dynamic dictionary that usually stores attributes
     - this means no additional attributes can be defined (which is more memory efficient)
+- the GroupSimParams object stores parameters for a group of spectra as arrays, and is
+  a sequence of SimParams objects, which are created when accessed
 """
 
 from collections import namedtuple
+from collections.abc import Sequence
+
+import numpy as np
 
 ###################################################################################################
 ###################################################################################################
@@ -86,10 +91,10 @@ class SimParams(namedtuple('SimParams', ['aperiodic_params', 'periodic_params',
 
     Parameters
     ----------
-    aperiodic_params : list
+    aperiodic_params : tuple
         Parameters that define the aperiodic component.
-    periodic_params : list or list of lists
-        Parameters that define the periodic component.
+    periodic_params : tuple of tuples
+        Parameters that define the periodic component, with a tuple per peak.
     nlv : float
         Noise level added to simulated spectrum.
 
@@ -98,3 +103,79 @@ class SimParams(namedtuple('SimParams', ['aperiodic_params', 'periodic_params',
     This object is a data object, based on a NamedTuple, with immutable data attributes.
     """
     __slots__ = ()
+
+
+class GroupSimParams(Sequence):
+    """Parameters that define a group of simulated power spectra, stored as arrays.
+
+    Parameters
+    ----------
+    aperiodic_params : 2d array
+        Aperiodic parameters, as [n_spectra, 3], with columns of [offset, knee, exponent].
+        Spectra defined in 'fixed' mode have a knee value of NaN.
+    periodic_params : 3d array
+        Periodic parameters, as [n_spectra, max_n_peaks, 3], with columns of [CF, PW, BW].
+        Peaks are sorted per spectrum, and spectra with fewer peaks are padded with NaN.
+    nlvs : 1d array
+        Noise level added to each simulated spectrum.
+    n_spectra : int, optional
+        Number of power spectra in the group. Defaults to the number of parameter definitions.
+
+    Notes
+    -----
+    Indexing this object returns SimParams objects, which are created from the stored arrays
+    when accessed. Any spectra beyond the number of parameter definitions are returned as None.
+    This object compares equal to a list or tuple of the same SimParams objects.
+
+    Examples
+    --------
+    Collect simulation parameters for a group of two power spectra:
+
+    >>> from fooof.sim.params import collect_group_sim_params
+    >>> sim_params = collect_group_sim_params([[1, 1], [1, 1.5]], [[10, 0.5, 1], []], [0, 0])
+    """
+
+    def __init__(self, aperiodic_params, periodic_params, nlvs, n_spectra=None):
+        """Initialize a GroupSimParams object."""
+
+        self.aperiodic_params = aperiodic_params
+        self.periodic_params = periodic_params
+        self.nlvs = nlvs
+        self.n_spectra = len(nlvs) if n_spectra is None else n_spectra
+
+    def __len__(self):
+
+        return self.n_spectra
+
+    def __getitem__(self, ind):
+
+        if isinstance(ind, slice):
+            return [self[cur_ind] for cur_ind in range(*ind.indices(len(self)))]
+
+        if not -len(self) <= ind < len(self):
+            raise IndexError('GroupSimParams index out of range.')
+        ind = ind % len(self)
+
+        if ind >= len(self.nlvs):
+            return None
+
+        # Only the knee marks missing values, as a NaN knee indicates the 'fixed' mode
+        ap_params = self.aperiodic_params[ind]
+        if np.isnan(ap_params[1]):
+            ap_params = ap_params[[0, 2]]
+        pe_params = self.periodic_params[ind]
+
+        return SimParams(tuple(ap_params.tolist()),
+                         tuple(map(tuple, pe_params[~np.isnan(pe_params[:, 0])].tolist())),
+                         self.nlvs[ind].item())
+
+    def __eq__(self, other):
+
+        if not isinstance(other, (GroupSimParams, list, tuple)):
+            return NotImplemented
+
+        return list(self) == list(other)
+
+    def __repr__(self):
+
+        return repr(list(self))
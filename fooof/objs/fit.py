@@ -1290,7 +1290,8 @@ class FOOOF():
     def _regenerate_freqs(self):
         """Regenerate the frequency vector, given the object metadata."""
 
-        self.freqs = gen_freqs(self.freq_range, self.freq_res)
+        # Copy the frequency vector, as arrays returned by `gen_freqs` are shared & read-only
+        self.freqs = gen_freqs(self.freq_range, self.freq_res).copy()
 
 
     def _regenerate_model(self):
@@ -1,6 +1,6 @@
 """"Simulation sub-module for FOOOF."""
 
-# Link the Sim Params object into `sim`, so it can be imported from here
-from fooof.data import SimParams
+# Link the Sim Params objects into `sim`, so they can be imported from here
+from fooof.data import SimParams, GroupSimParams
 
-from .gen import gen_freqs, gen_power_spectrum, gen_group_power_spectra
+from .gen import gen_freqs, gen_power_spectrum, gen_group_power_spectra, gen_power_vals_batch
@@ -1,17 +1,39 @@
 """Functions for generating model components and simulated power spectra."""
 
+from functools import lru_cache, partial
+from multiprocessing import cpu_count
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
-from fooof.core.utils import check_iter, check_flat
+from fooof.core.utils import check_iter, check_flat, group_peak_params
+from fooof.core.modutils import safe_import
 from fooof.core.funcs import get_ap_func, get_pe_func, infer_ap_func
+from fooof.core.funcs import expo_function, expo_nk_function
+from fooof.core.funcs import _sum_gaussians
 
-from fooof.sim.params import collect_sim_params
+from fooof.sim.params import collect_sim_params, collect_group_sim_params
 from fooof.sim.transform import rotate_spectrum, compute_rotation_offset
 
+numba = safe_import('numba')
+
+###################################################################################################
+###################################################################################################
+
+## Settings & Globals
+# Natural log of 10, used to compute powers of 10 as exponentials, which is faster than np.power
+_LN10 = np.log(10.0)
+
+# Functions & input scaling that compute powers of 10, such that ufunc(scale * x) is 10**x
+#   The options differ in the last bits of their outputs, so one is used, for all simulations,
+#   so that seeded simulations are reproducible. The numba kernel always uses exp.
+_POW10_OPTIONS = {'exp' : (np.exp, _LN10), 'exp2' : (np.exp2, np.log2(10.0))}
+_POW10_UFUNC, _POW10_SCALE = _POW10_OPTIONS['exp']
+
 ###################################################################################################
 ###################################################################################################
 
-def gen_freqs(freq_range, freq_res):
+def gen_freqs(freq_range, freq_res, dtype=np.float64):
     """Generate a frequency vector.
 
     Parameters
@@ -20,12 +42,20 @@ def gen_freqs(freq_range, freq_res):
         Frequency range to create frequencies across, as [f_low, f_high], inclusive.
     freq_res : float
         Frequency resolution of desired frequency vector.
+    dtype : data-type, optional, default: np.float64
+        Data type of the frequency vector.
 
     Returns
     -------
     freqs : 1d array
         Frequency values, in linear spacing.
 
+    Notes
+    -----
+    Frequency vectors are cached, such that repeated calls with the same definition return
+    the same array. As such, the returned array is read-only, and should be copied if it
+    needs to be edited in place.
+
     Examples
     --------
     Generate a vector of frequency values from 1 to 50:
@@ -33,16 +63,14 @@ def gen_freqs(freq_range, freq_res):
     >>> freqs = gen_freqs([1, 50], freq_res=0.5)
     """
 
-    # The end value has something added to it, to make sure the last value is included
-    #   It adds a fraction to not accidentally include points beyond range
-    #   due to rounding / or uneven division of the freq_res into range to simulate
-    freqs = np.arange(freq_range[0], freq_range[1] + (0.5 * freq_res), freq_res)
+    freqs = _gen_freqs_cached(float(freq_range[0]), float(freq_range[1]), float(freq_res),
+                              np.dtype(dtype))
 
     return freqs
 
 
 def gen_power_spectrum(freq_range, aperiodic_params, periodic_params, nlv=0.005,
-                       freq_res=0.5, f_rotation=None, return_params=False):
+                       freq_res=0.5, f_rotation=None, return_params=False, dtype=np.float64):
     """Generate a simulated power spectrum.
 
     Parameters
@@ -64,6 +92,11 @@ def gen_power_spectrum(freq_range, aperiodic_params, periodic_params, nlv=0.005,
         Should only be set if spectrum is to be rotated.
     return_params : bool, optional, default: False
         Whether to return the parameters for the simulated spectrum.
+    dtype : data-type, optional, default: np.float64
+        Data type of the simulated frequency and power values.
+        This only sets how values are stored: power values are computed in double precision,
+        and then stored in this type. Single precision (np.float32) halves the memory used,
+        but has reduced precision, and can only represent power values up to ~1e38.
 
     Returns
     -------
@@ -131,12 +164,13 @@ def gen_power_spectrum(freq_range, aperiodic_params, periodic_params, nlv=0.005,
     >>> freqs, powers = gen_power_spectrum([1, 50], [None, 2], [10, 0.5, 1], f_rotation=15)
     """
 
-    freqs = gen_freqs(freq_range, freq_res)
+    freqs = gen_freqs(freq_range, freq_res, dtype)
+    powers = np.empty(len(freqs), dtype=dtype)
 
     if f_rotation:
 
-        powers = gen_rotated_power_vals(freqs, aperiodic_params,
-                                        check_flat(periodic_params), nlv, f_rotation)
+        gen_rotated_power_vals(freqs, aperiodic_params, check_flat(periodic_params),
+                               nlv, f_rotation, out=powers)
 
         # The rotation changes the offset, so recalculate it's value & update params
         new_offset = compute_rotation_offset(aperiodic_params[1], f_rotation)
@@ -144,7 +178,7 @@ def gen_power_spectrum(freq_range, aperiodic_params, periodic_params, nlv=0.005,
 
     else:
 
-        powers = gen_power_vals(freqs, aperiodic_params, check_flat(periodic_params), nlv)
+        gen_power_vals(freqs, aperiodic_params, check_flat(periodic_params), nlv, out=powers)
 
     if return_params:
         sim_params = collect_sim_params(aperiodic_params, periodic_params, nlv)
@@ -154,7 +188,8 @@ def gen_power_spectrum(freq_range, aperiodic_params, periodic_params, nlv=0.005,
 
 
 def gen_group_power_spectra(n_spectra, freq_range, aperiodic_params, periodic_params, nlvs=0.005,
-                            freq_res=0.5, f_rotation=None, return_params=False):
+                            freq_res=0.5, f_rotation=None, return_params=False, dtype=np.float64,
+                            n_jobs=1):
     """Generate a group of simulated power spectra.
 
     Parameters
@@ -177,6 +212,14 @@ def gen_group_power_spectra(n_spectra, freq_range, aperiodic_params, periodic_pa
         Should only be set if spectra are to be rotated.
     return_params : bool, optional, default: False
         Whether to return the parameters for the simulated spectra.
+    dtype : data-type, optional, default: np.float64
+        Data type of the simulated frequency and power values.
+        This only sets how values are stored: power values are computed in double precision,
+        and then stored in this type. Single precision (np.float32) halves the memory used,
+        but has reduced precision, and can only represent power values up to ~1e38.
+    n_jobs : int, optional, default: 1
+        Number of threads to simulate spectra across, each simulating a block of spectra.
+        1 is no parallelization. -1 uses all available cores.
 
     Returns
     -------
@@ -184,8 +227,9 @@ def gen_group_power_spectra(n_spectra, freq_range, aperiodic_params, periodic_pa
         Frequency values, in linear spacing.
     powers : 2d array
         Matrix of power values, in linear spacing, as [n_power_spectra, n_freqs].
-    sim_params : list of SimParams
+    sim_params : GroupSimParams
         Definitions of parameters used for each spectrum. Has length of n_spectra.
+        Each spectrum is indexed as a SimParams object.
         Only returned if `return_params` is True.
 
     Notes
@@ -262,9 +306,8 @@ def gen_group_power_spectra(n_spectra, freq_range, aperiodic_params, periodic_pa
     """
 
     # Initialize things
-    freqs = gen_freqs(freq_range, freq_res)
-    powers = np.zeros([n_spectra, len(freqs)])
-    sim_params = [None] * n_spectra
+    freqs = gen_freqs(freq_range, freq_res, dtype)
+    powers = np.zeros([n_spectra, len(freqs)], dtype=dtype)
 
     # Check if inputs are generators, if not, make them into repeat generators
     ap_params = check_iter(aperiodic_params, n_spectra)
@@ -272,19 +315,34 @@ def gen_group_power_spectra(n_spectra, freq_range, aperiodic_params, periodic_pa
     nlvs = check_iter(nlvs, n_spectra)
     f_rots = check_iter(f_rotation, n_spectra)
 
-    # Simulate power spectra
-    for ind, ap, pe, nlv, f_rot in zip(range(n_spectra), ap_params, pe_params, nlvs, f_rots):
+    # Collect the parameter definitions for each spectrum
+    #   Generators are sampled here, once per spectrum, so that spectra can be simulated together
+    #   Sampled parameters are copied, as generators, such as `param_iter`, may update in place
+    all_params = [(list(ap), group_peak_params(pe), nlv, f_rot) for _, ap, pe, nlv, f_rot
+                  in zip(range(n_spectra), ap_params, pe_params, nlvs, f_rots)]
+    aps, pes, nlv_vals, f_rot_vals = zip(*all_params) if all_params else [()] * 4
 
-        if f_rotation:
-            powers[ind, :] = gen_rotated_power_vals(freqs, ap, check_flat(pe), nlv, f_rot)
-            aperiodic_params = [compute_rotation_offset(ap[1], f_rot), ap[1]]
+    # Simulate power spectra, from parameters stacked across spectra
+    if all_params:
 
+        # Aperiodic parameters are only stacked if used, as rotated spectra recompute them
+        pe_arr = _stack_pe_params(pes)
+        if f_rotation:
+            _gen_rotated_power_vals_stacked(freqs, aps, pe_arr,
+                                            _gen_noise_stacked(freqs, nlv_vals, len(aps)),
+                                            f_rot_vals, n_jobs, out=powers[:len(all_params)])
         else:
-            powers[ind, :] = gen_power_vals(freqs, ap, check_flat(pe), nlv)
-
-        sim_params[ind] = collect_sim_params(ap, pe, nlv)
+            gen_power_vals_batch(freqs, _stack_ap_params(aps), pe_arr, nlv_vals, n_jobs,
+                                 out=powers[:len(all_params)])
 
     if return_params:
+
+        # The rotation changes the offset, so recalculate their values & update params
+        if f_rotation:
+            aps = [[compute_rotation_offset(ap[1], f_rot), ap[1]]
+                   for ap, f_rot in zip(aps, f_rot_vals)]
+
+        sim_params = collect_group_sim_params(aps, pes, nlv_vals, n_spectra)
         return freqs, powers, sim_params
     else:
         return freqs, powers
@@ -370,7 +428,7 @@ def gen_noise(freqs, nlv):
     return noise_vals
 
 
-def gen_power_vals(freqs, aperiodic_params, periodic_params, nlv):
+def gen_power_vals(freqs, aperiodic_params, periodic_params, nlv, out=None):
     """Generate power values for a simulated power spectrum.
 
     Parameters
@@ -383,6 +441,8 @@ def gen_power_vals(freqs, aperiodic_params, periodic_params, nlv):
         Parameters to create the periodic component of the power spectrum.
     nlv : float
         Noise level to add to generated power spectrum.
+    out : 1d array, optional
+        Array to store the power values in. If not provided, a new array is created.
 
     Returns
     -------
@@ -397,16 +457,36 @@ def gen_power_vals(freqs, aperiodic_params, periodic_params, nlv):
     - Returns the power spectrum in linear spacing, as is used for simulating power spectra.
     """
 
-    ap_vals = gen_aperiodic(freqs, aperiodic_params)
-    pe_vals = gen_periodic(freqs, periodic_params)
-    noise = gen_noise(freqs, nlv)
+    # Noise is only generated if requested, skipping the random draws for zero noise
+    noise = gen_noise(freqs, nlv) if nlv else None
+
+    if numba:
+
+        # If available, use the compiled kernel, which computes all components in one pass
+        #   Parameters are organized as a group of one spectrum, as used by the kernel
+        ap_arr = np.zeros([1, 3])
+        ap_arr[0, [0, 2] if len(aperiodic_params) == 2 else slice(None)] = aperiodic_params
 
-    powers = np.power(10, ap_vals + pe_vals + noise)
+        powers = np.empty(len(freqs)) if out is None else out
+        _gen_power_vals_stacked(freqs, ap_arr, group_peak_params(periodic_params)[None],
+                                None if noise is None else noise[None, :], out=powers[None, :])
+
+    else:
+
+        ap_vals = gen_aperiodic(freqs, aperiodic_params)
+        pe_vals = gen_periodic(freqs, periodic_params)
+
+        # Combine components in place, in the output array, or else in the aperiodic values
+        powers = np.add(ap_vals, pe_vals, out=ap_vals if out is None else out)
+        if noise is not None:
+            np.add(powers, noise, out=powers)
+        np.multiply(powers, _POW10_SCALE, out=powers)
+        _POW10_UFUNC(powers, out=powers)
 
     return powers
 
 
-def gen_rotated_power_vals(freqs, aperiodic_params, periodic_params, nlv, f_rotation):
+def gen_rotated_power_vals(freqs, aperiodic_params, periodic_params, nlv, f_rotation, out=None):
     """Generate power values for a simulated power spectrum, rotated around a given frequency.
 
     Parameters
@@ -421,6 +501,8 @@ def gen_rotated_power_vals(freqs, aperiodic_params, periodic_params, nlv, f_rota
         Noise level to add to generated power spectrum.
     f_rotation : float
         Frequency value, in Hz, about which rotation is applied, at which power is unchanged.
+    out : 1d array, optional
+        Array to store the power values in. If not provided, a new array is created.
 
     Returns
     -------
@@ -433,15 +515,87 @@ def gen_rotated_power_vals(freqs, aperiodic_params, periodic_params, nlv, f_rota
         If a rotation is requested on a power spectrum with a knee, as this is not supported.
     """
 
-    if len(aperiodic_params) == 3:
-        raise ValueError('Cannot rotate power spectra generated with a knee.')
-
-    powers = gen_power_vals(freqs, [0, 0], periodic_params, nlv)
-    powers = rotate_spectrum(freqs, powers, aperiodic_params[1], f_rotation)
+    powers = np.empty(len(freqs)) if out is None else out
+    _gen_rotated_power_vals_stacked(freqs, [aperiodic_params],
+                                    group_peak_params(periodic_params)[None],
+                                    gen_noise(freqs, nlv)[None, :] if nlv else None,
+                                    [f_rotation], out=powers[None, :])
 
     return powers
 
 
+def gen_power_vals_batch(freqs, aperiodic_params, periodic_params, nlvs, n_jobs=1, out=None):
+    """Generate power values for a group of simulated power spectra, from stacked parameters.
+
+    Parameters
+    ----------
+    freqs : 1d array
+        Frequency vector to create power values for.
+    aperiodic_params : 2d array
+        Parameters to create the aperiodic component of each power spectrum,
+        as [n_power_spectra, 2] for 'fixed' mode, or [n_power_spectra, 3] for 'knee' mode.
+        In 'knee' mode, a knee value of NaN is treated as no knee.
+    periodic_params : 3d array
+        Parameters to create the periodic component of each power spectrum,
+        as [n_power_spectra, n_peaks, 3], with each peak defined as [CF, PW, BW].
+        Spectra with fewer peaks can be padded with peaks of NaN, or with a height of 0.
+    nlvs : float or 1d array
+        Noise level to add to each generated power spectrum.
+    n_jobs : int, optional, default: 1
+        Number of jobs to run in parallel.
+        1 is no parallelization. -1 uses all available cores.
+    out : 2d array, optional
+        Array to store the power values in. If not provided, a new array is created.
+
+    Returns
+    -------
+    powers : 2d array
+        Matrix of power values, in linear spacing, as [n_power_spectra, n_freqs].
+
+    Raises
+    ------
+    ValueError
+        If the aperiodic parameters are not organized as 2 or 3 parameters per spectrum.
+
+    Notes
+    -----
+    This is the function used to simulate power values by `gen_group_power_spectra`,
+    and can be used directly for parameters that are already organized as arrays.
+    For example, the parameters stored in a GroupSimParams object can be passed in directly.
+
+    Noise is drawn in a single call across all spectra, from numpy's random state,
+    as set by `set_random_seed`. If no spectra have noise, the random draws are skipped.
+
+    Examples
+    --------
+    Generate power values for two power spectra, one with and one without a peak:
+
+    >>> freqs = gen_freqs([1, 50], 0.5)
+    >>> powers = gen_power_vals_batch(freqs, [[1, 1], [1, 1.5]],
+    ...                               [[[10, 0.5, 1]], [[np.nan] * 3]], [0.01, 0.01])
+    """
+
+    aperiodic_params = np.asarray(aperiodic_params, dtype=float)
+    if aperiodic_params.ndim != 2 or aperiodic_params.shape[1] not in (2, 3):
+        raise ValueError("Input 'aperiodic_params' should be a 2d array, "
+                         "with 2 or 3 parameters per spectrum.")
+    n_spectra = len(aperiodic_params)
+
+    # Aperiodic parameters are organized as [offset, knee, exponent], with a knee of 0 if unused
+    ap_arr = np.zeros([n_spectra, 3])
+    ap_arr[:, [0, 2] if aperiodic_params.shape[1] == 2 else slice(None)] = aperiodic_params
+    ap_arr[:, 1] = np.nan_to_num(ap_arr[:, 1])
+
+    # Padded peaks are given a width of 1, so that they evaluate to zero without dividing by zero
+    #   Peaks are reshaped, so that spectra without any peaks are given an empty set of peaks
+    periodic_params = np.asarray(periodic_params, dtype=float).reshape([n_spectra, -1, 3])
+    pe_arr = np.where(np.isnan(periodic_params), [0, 0, 1], periodic_params)
+
+    noise = _gen_noise_stacked(freqs, nlvs, n_spectra)
+
+    return _gen_power_vals_blocks(freqs, ap_arr, pe_arr, noise, n_jobs, out)
+
+
 def gen_model(freqs, aperiodic_params, periodic_params, return_components=False):
     """Generate a power spectrum model for a given parameter definition.
 
@@ -483,3 +637,428 @@ def gen_model(freqs, aperiodic_params, periodic_params, return_components=False)
         return full_model, pe_fit, ap_fit
     else:
         return full_model
+
+
+@lru_cache(maxsize=32)
+def _gen_freqs_cached(f_low, f_high, freq_res, dtype):
+    """Generate a frequency vector, caching the result for repeated definitions.
+
+    Parameters
+    ----------
+    f_low, f_high : float
+        Frequency range to create frequencies across, inclusive.
+    freq_res : float
+        Frequency resolution of desired frequency vector.
+    dtype : numpy.dtype
+        Data type of the frequency vector.
+
+    Returns
+    -------
+    freqs : 1d array
+        Frequency values, in linear spacing, as a read-only array.
+    """
+
+    # The end value has something added to it, to make sure the last value is included
+    #   It adds a fraction to not accidentally include points beyond range
+    #   due to rounding / or uneven division of the freq_res into range to simulate
+    #   Values are computed at double precision, and then cast, to keep values on the grid
+    freqs = np.arange(f_low, f_high + (0.5 * freq_res), freq_res).astype(dtype, copy=False)
+
+    # The array is shared across calls, so it is set as read-only to protect the cached values
+    freqs.setflags(write=False)
+
+    return freqs
+
+
+def _stack_ap_params(aperiodic_params):
+    """Stack aperiodic parameter definitions across a group of spectra into an array.
+
+    Parameters
+    ----------
+    aperiodic_params : list of list of float
+        Aperiodic parameters for each spectrum, each of length 2 or 3.
+
+    Returns
+    -------
+    ap_arr : 2d array
+        Aperiodic parameters, as [n_spectra, 3], with columns of [offset, knee, exponent].
+        Spectra defined in 'fixed' mode are given a knee value of 0.
+    """
+
+    # Infer the aperiodic mode once per parameter length, and fill all matching spectra together
+    ap_lens = np.array([len(ap) for ap in aperiodic_params])
+    ap_arr = np.zeros([len(aperiodic_params), 3])
+    for n_params, first_ind in zip(*np.unique(ap_lens, return_index=True)):
+        cols = [0, 2] if infer_ap_func(aperiodic_params[first_ind]) == 'fixed' else [0, 1, 2]
+        rows = np.flatnonzero(ap_lens == n_params)
+        ap_arr[np.ix_(rows, cols)] = [aperiodic_params[row] for row in rows]
+
+    return ap_arr
+
+
+def _stack_pe_params(periodic_params):
+    """Stack periodic parameter definitions across a group of spectra into an array.
+
+    Parameters
+    ----------
+    periodic_params : list of list of float or list of list of list of float
+        Periodic parameters for each spectrum.
+
+    Returns
+    -------
+    pe_arr : 3d array
+        Periodic parameters, as [n_spectra, max_n_peaks, 3], with columns of [CF, PW, BW].
+        Spectra with fewer peaks are padded with peaks with a height of 0.
+    """
+
+    peaks = [group_peak_params(pe) for pe in periodic_params]
+    max_n_peaks = max(len(pe) for pe in peaks)
+
+    # Padded peaks are given a width of 1, so that they evaluate to zero without dividing by zero
+    pe_arr = np.zeros([len(peaks), max_n_peaks, 3])
+    pe_arr[:, :, 2] = 1
+    for ind, pe in enumerate(peaks):
+        pe_arr[ind, :len(pe), :] = pe
+
+    return pe_arr
+
+
+def _gen_power_vals_stacked(freqs, ap_arr, pe_arr, noise, out=None):
+    """Generate power values for a group of simulated power spectra, all at once.
+
+    Parameters
+    ----------
+    freqs : 1d array
+        Frequency vector to create power values for.
+    ap_arr : 2d array
+        Aperiodic parameters, as [n_power_spectra, 3], with columns of [offset, knee, exponent].
+    pe_arr : 3d array
+        Periodic parameters, as [n_power_spectra, max_n_peaks, 3], with columns of [CF, PW, BW].
+    noise : 2d array or None
+        Noise values to add to each generated power spectrum, as [n_power_spectra, n_freqs].
+        If None, no noise is added.
+    out : 2d array, optional
+        Array to store the power values in. If not provided, a new array is created.
+
+    Returns
+    -------
+    powers : 2d array
+        Matrix of power values, in linear spacing, as [n_power_spectra, n_freqs].
+
+    Notes
+    -----
+    This computes the same values as calling `gen_power_vals` per spectrum, but stacks
+    the parameters across spectra, so that each step is a single operation across the group.
+
+    If numba is available, the power values are computed by a compiled kernel, which
+    computes all components for each value in a single pass.
+
+    Noise values are passed in, rather than drawn in the kernel, so that they follow
+    numpy's random state, as set by `set_random_seed`.
+    """
+
+    if numba:
+
+        freqs = np.asarray(freqs, dtype=float)
+        powers = np.empty([len(ap_arr), len(freqs)]) if out is None else out
+
+        # Peaks can be computed with a recurrence if frequencies are evenly spaced
+        #   This is not used for zero width peaks, which are undefined at their center
+        use_recurrence = _check_even_spacing(freqs) and np.all(pe_arr[:, :, 2] > 0)
+
+        _power_vals_kernel(freqs, np.log10(freqs), ap_arr, pe_arr, noise, powers,
+                           use_recurrence)
+
+    else:
+
+        # Parameters are passed as columns, so that components are computed across spectra
+        #   Spectra without a knee share the log of the frequencies, which is computed once
+        offsets, knees, exps = [ap_arr[:, ind, None] for ind in range(3)]
+        ap_vals = expo_nk_function(freqs, offsets, exps)
+        knee_rows = knees[:, 0] != 0
+        if np.any(knee_rows):
+            ap_vals[knee_rows] = expo_function(freqs, offsets[knee_rows],
+                                               knees[knee_rows], exps[knee_rows])
+
+        pe_vals = _sum_gaussians(freqs, *[pe_arr[:, :, ind] for ind in range(3)])
+
+        # Combine components in place, in the output array, or else in the aperiodic values
+        powers = np.add(ap_vals, pe_vals, out=ap_vals if out is None else out)
+        if noise is not None:
+            np.add(powers, noise, out=powers)
+        np.multiply(powers, _POW10_SCALE, out=powers)
+        _POW10_UFUNC(powers, out=powers)
+
+    return powers
+
+
+def _gen_rotated_power_vals_stacked(freqs, aperiodic_params, pe_arr, noise, f_rotations,
+                                    n_jobs=1, out=None):
+    """Generate power values for a group of simulated power spectra, each rotated.
+
+    Parameters
+    ----------
+    freqs : 1d array
+        Frequency vector to create power values for.
+    aperiodic_params : list of list of float
+        Parameters to create the aperiodic component of each power spectrum.
+    pe_arr : 3d array
+        Periodic parameters, as [n_power_spectra, max_n_peaks, 3], with columns of [CF, PW, BW].
+    noise : 2d array or None
+        Noise values to add to each generated power spectrum, as [n_power_spectra, n_freqs].
+        If None, no noise is added.
+    f_rotations : list of float
+        Frequency value, in Hz, about which rotation is applied, for each power spectrum.
+    n_jobs : int, optional, default: 1
+        Number of jobs to run in parallel.
+    out : 2d array, optional
+        Array to store the power values in. If not provided, a new array is created.
+
+    Returns
+    -------
+    powers : 2d array
+        Matrix of power values, in linear spacing, as [n_power_spectra, n_freqs].
+
+    Raises
+    ------
+    ValueError
+        If a rotation is requested on a power spectrum with a knee, as this is not supported.
+    """
+
+    # Check all parameters prior to simulating, so that invalid definitions fail early
+    if any(len(ap) == 3 for ap in aperiodic_params):
+        raise ValueError('Cannot rotate power spectra generated with a knee.')
+
+    # Spectra are simulated without an aperiodic component, and then rotated
+    powers = _gen_power_vals_blocks(freqs, np.zeros([len(aperiodic_params), 3]), pe_arr,
+                                    noise, n_jobs, out)
+
+    for ind, (ap, f_rotation) in enumerate(zip(aperiodic_params, f_rotations)):
+        powers[ind, :] = rotate_spectrum(freqs, powers[ind, :], ap[1], f_rotation)
+
+    return powers
+
+
+def _check_even_spacing(freqs, rtol=1e-9):
+    """Check whether a frequency vector is evenly spaced, with a constant time check.
+
+    Parameters
+    ----------
+    freqs : 1d array
+        Frequency values.
+    rtol : float, optional, default: 1e-9
+        Relative tolerance for comparing frequency steps.
+
+    Returns
+    -------
+    bool
+        Whether the frequency values are evenly spaced.
+
+    Notes
+    -----
+    This checks the first and last steps against the average step across the whole range,
+    rather than checking every step, as this is run each time power values are simulated.
+    Frequency vectors from `gen_freqs` are evenly spaced by construction.
+    """
+
+    n_freqs = len(freqs)
+    if n_freqs < 2:
+        return False
+
+    f_step = (freqs[-1] - freqs[0]) / (n_freqs - 1)
+    tol = rtol * abs(f_step)
+
+    return bool(abs(freqs[1] - freqs[0] - f_step) <= tol and \
+                abs(freqs[-1] - freqs[-2] - f_step) <= tol)
+
+
+def _gen_noise_stacked(freqs, nlvs, n_spectra):
+    """Generate noise values for a group of simulated power spectra.
+
+    Parameters
+    ----------
+    freqs : 1d array
+        Frequency vector to create noise values for.
+    nlvs : float or 1d array
+        Noise level to generate for each power spectrum.
+    n_spectra : int
+        Number of power spectra to generate noise values for.
+
+    Returns
+    -------
+    noise : 2d array or None
+        Noise values, as [n_spectra, n_freqs]. If no spectra have noise, this is None.
+
+    Notes
+    -----
+    Noise is drawn in a single call across all spectra, and scaled per spectrum in place.
+    These are the same values as calling `gen_noise` for each spectrum, in order.
+    """
+
+    nlvs = np.broadcast_to(np.asarray(nlvs, dtype=float), [n_spectra])
+
+    # If no spectra have noise, the random draws are skipped
+    noise = None
+    if np.any(nlvs):
+        noise = np.random.standard_normal([n_spectra, len(freqs)])
+        noise *= nlvs[:, None]
+
+    return noise
+
+
+def _gen_power_vals_blocks(freqs, ap_arr, pe_arr, noise, n_jobs=1, out=None):
+    """Generate power values for a group of simulated power spectra, in blocks across jobs.
+
+    Parameters
+    ----------
+    freqs : 1d array
+        Frequency vector to create power values for.
+    ap_arr : 2d array
+        Aperiodic parameters, as [n_power_spectra, 3], with columns of [offset, knee, exponent].
+    pe_arr : 3d array
+        Periodic parameters, as [n_power_spectra, max_n_peaks, 3], with columns of [CF, PW, BW].
+    noise : 2d array or None
+        Noise values to add to each generated power spectrum, as [n_power_spectra, n_freqs].
+        If None, no noise is added.
+    n_jobs : int, optional, default: 1
+        Number of jobs to run in parallel.
+        1 is no parallelization. -1 uses all available cores.
+    out : 2d array, optional
+        Array to store the power values in. If not provided, a new array is created.
+
+    Returns
+    -------
+    powers : 2d array
+        Matrix of power values, in linear spacing, as [n_power_spectra, n_freqs].
+    """
+
+    n_spectra = len(ap_arr)
+    powers = np.empty([n_spectra, len(freqs)]) if out is None else out
+
+    n_jobs = min(cpu_count() if n_jobs == -1 else n_jobs, n_spectra)
+    if n_jobs <= 1:
+        return _gen_power_vals_stacked(freqs, ap_arr, pe_arr, noise, out=powers)
+
+    # Spectra are simulated in blocks of consecutive spectra, one block per job
+    blocks = [slice(inds[0], inds[-1] + 1) for inds in np.array_split(range(n_spectra), n_jobs)]
+    sim_block = partial(_sim_block, freqs=freqs, ap_arr=ap_arr, pe_arr=pe_arr,
+                        noise=noise, out=powers)
+
+    with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+        list(pool.map(sim_block, blocks))
+
+    return powers
+
+
+def _sim_block(block, freqs, ap_arr, pe_arr, noise, out):
+    """Helper function for simulating a block of spectra, including in parallel."""
+
+    _gen_power_vals_stacked(freqs, ap_arr[block], pe_arr[block],
+                            None if noise is None else noise[block], out=out[block])
+
+
+if numba:
+
+    @numba.njit(cache=True, nogil=True, error_model='numpy')
+    def _power_vals_kernel(freqs, log_freqs, ap_arr, pe_arr, noise, powers, use_recurrence):
+        """Compiled kernel to compute power values from stacked parameters, in place.
+
+        Parameters
+        ----------
+        freqs : 1d array
+            Frequency vector to create power values for.
+        log_freqs : 1d array
+            Log10 of the frequency vector, used for spectra without a knee.
+        ap_arr : 2d array
+            Aperiodic parameters, as [n_spectra, 3], with columns of [offset, knee, exponent].
+        pe_arr : 3d array
+            Periodic parameters, as [n_spectra, n_peaks, 3], with columns of [CF, PW, BW].
+        noise : 2d array or None
+            Noise values to add, as [n_spectra, n_freqs]. If None, no noise is added.
+        powers : 2d array
+            Array to fill with power values, in linear spacing, as [n_spectra, n_freqs].
+        use_recurrence : bool
+            Whether to compute peaks with a recurrence, which requires evenly spaced frequencies.
+        """
+
+        n_freqs = freqs.shape[0]
+        vals = np.empty(n_freqs)
+
+        for s_ind in range(powers.shape[0]):
+
+            offset, knee, exp = ap_arr[s_ind, 0], ap_arr[s_ind, 1], ap_arr[s_ind, 2]
+
+            for f_ind in range(n_freqs):
+                if knee == 0:
+                    vals[f_ind] = offset - exp * log_freqs[f_ind]
+                else:
+                    vals[f_ind] = offset - np.log10(knee + freqs[f_ind]**exp)
+
+            for p_ind in range(pe_arr.shape[1]):
+
+                ctr = pe_arr[s_ind, p_ind, 0]
+                hgt = pe_arr[s_ind, p_ind, 1]
+                wid = pe_arr[s_ind, p_ind, 2]
+
+                if hgt == 0:
+                    continue
+
+                if use_recurrence:
+                    _add_gaussian_recurrence(freqs[0], freqs[1] - freqs[0], ctr, hgt, wid, vals)
+                else:
+                    for f_ind in range(n_freqs):
+                        zz = (freqs[f_ind] - ctr) * (1 / wid)
+                        vals[f_ind] += hgt * np.exp(-0.5 * zz * zz)
+
+            if noise is not None:
+                for f_ind in range(n_freqs):
+                    vals[f_ind] += noise[s_ind, f_ind]
+
+            for f_ind in range(n_freqs):
+                powers[s_ind, f_ind] = np.exp(_LN10 * vals[f_ind])
+
+
+    @numba.njit(cache=True, nogil=True, error_model='numpy')
+    def _add_gaussian_recurrence(f_start, f_step, ctr, hgt, wid, vals):
+        """Compiled kernel to add a gaussian to evenly spaced values, using a recurrence.
+
+        Parameters
+        ----------
+        f_start, f_step : float
+            Start and step size of the evenly spaced frequency values.
+        ctr, hgt, wid : float
+            Center, height and width of the gaussian.
+        vals : 1d array
+            Values to add the gaussian to, in place.
+
+        Notes
+        -----
+        Starting from the frequency closest to the center, the gaussian is computed outwards
+        by multiplying by a ratio between neighbouring values, which itself is updated by a
+        constant factor at each step. This needs only three exponentials per direction,
+        rather than one per frequency value.
+        """
+
+        n_freqs = vals.shape[0]
+        inv_var = 1 / (2 * wid * wid)
+
+        start = min(max(int(round((ctr - f_start) / f_step)), 0), n_freqs - 1)
+        dist = f_start + start * f_step - ctr
+
+        start_val = hgt * np.exp(-dist * dist * inv_var)
+        factor = np.exp(-2 * f_step * f_step * inv_var)
+        vals[start] += start_val
+
+        # Step upwards, and then downwards, from the closest frequency to the center
+        for direction in (1, -1):
+
+            step = direction * f_step
+            val = start_val
+            ratio = np.exp(-(2 * dist * step + step * step) * inv_var)
+
+            f_ind = start + direction
+            while 0 <= f_ind < n_freqs:
+                val *= ratio
+                ratio *= factor
+                vals[f_ind] += val
+                f_ind += direction
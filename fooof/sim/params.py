@@ -2,12 +2,12 @@
 
 import numpy as np
 
-from fooof.core.utils import group_three, check_flat
+from fooof.core.utils import group_peak_params, check_flat
 from fooof.core.info import get_indices
 from fooof.core.funcs import infer_ap_func
 from fooof.core.errors import InconsistentDataError
 
-from fooof.data import SimParams
+from fooof.data import SimParams, GroupSimParams
 
 ###################################################################################################
 ###################################################################################################
@@ -30,9 +30,51 @@ def collect_sim_params(aperiodic_params, periodic_params, nlv):
         Object containing the simulation parameters.
     """
 
-    return SimParams(aperiodic_params.copy(),
-                     sorted(group_three(check_flat(periodic_params))),
-                     nlv)
+    # Sort peaks by their parameters, in order of center frequency, then power, then bandwidth
+    peaks = group_peak_params(periodic_params)
+    peaks = peaks[np.lexsort(peaks.T[::-1])]
+
+    # Parameters are stored as tuples, which are immutable, so they do not need to be copied
+    return SimParams(tuple(aperiodic_params), tuple(map(tuple, peaks.tolist())), nlv)
+
+
+def collect_group_sim_params(aperiodic_params, periodic_params, nlvs, n_spectra=None):
+    """Collect simulation parameters across a group of power spectra into a GroupSimParams object.
+
+    Parameters
+    ----------
+    aperiodic_params : list of list of float
+        Parameters of the aperiodic component of each power spectrum.
+    periodic_params : list of list of float or list of list of list of float
+        Parameters of the periodic component of each power spectrum.
+    nlvs : list of float
+        Noise level of each power spectrum.
+    n_spectra : int, optional
+        Number of power spectra in the group, if more than the number of parameter definitions.
+        Any power spectra without parameter definitions are given parameters of None.
+
+    Returns
+    -------
+    GroupSimParams
+        Object containing the simulation parameters.
+    """
+
+    peaks = [group_peak_params(pe) for pe in periodic_params]
+    max_n_peaks = max([len(pe) for pe in peaks], default=0)
+
+    # Parameters are stored in arrays, padded with NaN for missing knees & peaks
+    ap_arr = np.full([len(aperiodic_params), 3], np.nan)
+    pe_arr = np.full([len(peaks), max_n_peaks, 3], np.nan)
+    for ind, (ap, pe) in enumerate(zip(aperiodic_params, peaks)):
+        ap_arr[ind, [0, 2] if len(ap) == 2 else slice(None)] = ap
+        pe_arr[ind, :len(pe), :] = pe
+
+    # Sort peaks by their parameters, in order of center frequency, then power, then bandwidth
+    #   Padded peaks are sorted after all defined peaks
+    order = np.lexsort(pe_arr.transpose(2, 0, 1)[::-1], axis=-1)
+    pe_arr = np.take_along_axis(pe_arr, order[..., None], axis=1)
+
+    return GroupSimParams(ap_arr, pe_arr, np.array(nlvs, dtype=float), n_spectra)
 
 
 def update_sim_ap_params(sim_params, delta, field=None):
@@ -59,7 +101,7 @@ def update_sim_ap_params(sim_params, delta, field=None):
     """
 
     # Grab the aperiodic parameters that need updating
-    ap_params = sim_params.aperiodic_params.copy()
+    ap_params = list(sim_params.aperiodic_params)
 
     # If field isn't specified, check shapes line up and update across parameters
     if not field:
@@ -77,7 +119,7 @@ def update_sim_ap_params(sim_params, delta, field=None):
             ap_params[data_ind] = ap_params[data_ind] + cur_delta
 
     # Replace parameters. Note that this copies a new object, as data objects are immutable
-    new_sim_params = sim_params._replace(aperiodic_params=ap_params)
+    new_sim_params = sim_params._replace(aperiodic_params=tuple(ap_params))
 
     return new_sim_params
 
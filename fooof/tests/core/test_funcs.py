@@ -26,6 +26,13 @@ def test_gaussian_function():
     assert max(ys) == hgt
     assert np.allclose([i/sum(ys) for i in ys], norm.pdf(xs, ctr, wid))
 
+    # Check multiple peaks are the sum of each peak
+    ys_multi = gaussian_function(xs, ctr, hgt, wid, 20, 2, 5)
+    assert np.allclose(ys_multi, ys + gaussian_function(xs, 20, 2, 5))
+
+    # Check no peaks gives all zeros
+    assert not np.any(gaussian_function(xs))
+
 def test_expo_function():
 
     off, knee, exp = 10, 5, 2
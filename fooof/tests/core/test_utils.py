@@ -20,6 +20,16 @@ def test_group_three():
     with raises(ValueError):
         group_three([0, 1, 2, 3])
 
+def test_group_peak_params():
+
+    out = group_peak_params([0, 1, 2, 3, 4, 5])
+    assert array_equal(out, [[0, 1, 2], [3, 4, 5]])
+    assert array_equal(group_peak_params([[0, 1, 2], [3, 4, 5]]), out)
+    assert group_peak_params([]).shape == (0, 3)
+
+    with raises(ValueError):
+        group_peak_params([0, 1, 2, 3])
+
 def test_dict_array_to_lst():
 
     t_dict = {'a' : 1, 'b' : np.array([1, 2, 3]), 'c' : [4, 5, 6], 'd' : np.array([7, 8, 9])}
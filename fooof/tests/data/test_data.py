@@ -4,6 +4,8 @@ For testing the data objects, the testing approach is to check that the object
 has the expected fields, given what is defined in the object description.
 """
 
+import numpy as np
+
 from fooof.core.items import OBJ_DESC
 
 from fooof.data.data import *
@@ -43,3 +45,18 @@ def test_sim_params():
 
     for field in ['aperiodic_params', 'periodic_params', 'nlv']:
         assert getattr(sim_params, field)
+
+def test_group_sim_params():
+
+    group_sim_params = GroupSimParams(np.array([[1, np.nan, 1], [1, 10, 2]]),
+                                      np.array([[[10, 1, 1]], [[np.nan] * 3]]),
+                                      np.array([0.05, 0]))
+    assert len(group_sim_params) == 2
+
+    for sim_params in group_sim_params:
+        assert isinstance(sim_params, SimParams)
+        for field in ['aperiodic_params', 'periodic_params', 'nlv']:
+            assert hasattr(sim_params, field)
+
+    assert group_sim_params[0] == SimParams((1, 1), ((10, 1, 1),), 0.05)
+    assert group_sim_params[1] == SimParams((1, 10, 2), (), 0)
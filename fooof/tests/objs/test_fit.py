@@ -207,6 +207,8 @@ def test_fooof_load():
     file_name_dat = 'test_fooof_dat'
     tfm.load(file_name_dat, TEST_DATA_PATH)
     assert tfm.power_spectrum is not None
+    # Test that the regenerated frequencies can be edited
+    assert tfm.freqs.flags.writeable
     # Test that settings and results are None
     for setting in OBJ_DESC['settings']:
         assert getattr(tfm, setting) is None
@@ -1,10 +1,17 @@
 """Test functions for fooof.sim.gen"""
 
+import pytest
 import numpy as np
 from numpy import array_equal
+from py.test import raises
+
+from fooof.core.utils import check_flat
+from fooof.sim.utils import set_random_seed
+from fooof.sim.params import Stepper, param_iter, update_sim_ap_params
 
 from fooof.tests.tutils import default_group_params
 
+from fooof.sim import gen as sim_gen
 from fooof.sim.gen import *
 
 ###################################################################################################
@@ -21,6 +28,15 @@ def test_gen_freqs():
     assert freqs.max() == f_range[1]
     assert np.mean(np.diff(freqs)) == f_res
 
+    # Check repeated calls return the same, read-only, array
+    assert gen_freqs(f_range, f_res) is freqs
+    assert not freqs.flags.writeable
+
+    # Check generating frequencies with single precision
+    freqs_32 = gen_freqs(f_range, f_res, dtype=np.float32)
+    assert freqs_32.dtype == np.float32
+    assert np.allclose(freqs_32, freqs)
+
 def test_gen_power_spectrum():
 
     freq_range = [3, 50]
@@ -41,6 +57,18 @@ def test_gen_power_spectrum():
     assert np.all(ys)
     assert len(xs) == len(ys)
 
+def test_gen_power_spectrum_dtype():
+
+    xs, ys = gen_power_spectrum([3, 50], [1, 2], [10, 0.5, 2], nlv=0, dtype=np.float32)
+    assert xs.dtype == ys.dtype == np.float32
+
+    _, ys_64 = gen_power_spectrum([3, 50], [1, 2], [10, 0.5, 2], nlv=0)
+    assert np.allclose(ys, ys_64, rtol=1e-5)
+
+    xs, ys = gen_group_power_spectra(2, [3, 50], [1, 2], [10, 0.5, 2], dtype=np.float32)
+    assert xs.dtype == ys.dtype == np.float32
+    assert np.all(np.isfinite(ys))
+
 def test_gen_power_spectrum_return_params():
 
     freq_range = [3, 50]
@@ -80,6 +108,19 @@ def test_gen_group_power_spectra():
     assert np.all(xs)
     assert np.all(ys)
 
+    # Test with a rotation applied, with offsets not defined
+    xs, ys = gen_group_power_spectra(2, [3, 50], [[None, 1], [None, 2]], [10, 0.5, 1],
+                                     nlvs=0, f_rotation=f_rotation)
+    for ind, exp in enumerate([1, 2]):
+        exp_ys = gen_rotated_power_vals(xs, [None, exp], [10, 0.5, 1], 0, f_rotation)
+        assert np.allclose(ys[ind, :], exp_ys)
+
+    # Test simulating in parallel, including with a rotation applied
+    for f_rotation in [None, 20]:
+        xs, ys = gen_group_power_spectra(n_spectra, *default_group_params(),
+                                         f_rotation=f_rotation, n_jobs=-1)
+        assert np.all(ys)
+
 def test_gen_group_power_spectra_return_params():
 
     n_spectra = 3
@@ -97,6 +138,130 @@ def test_gen_group_power_spectra_return_params():
     assert array_equal(sp.periodic_params, [pes])
     assert sp.nlv == nlv
 
+def test_gen_group_power_spectra_rotation_return_params():
+
+    f_rotation = 20
+    aps = [[None, 1], [None, 1.5]]
+    pes = [10, 0.5, 1]
+
+    xs, ys, sim_params = gen_group_power_spectra(2, [1, 50], aps, pes, nlvs=0,
+                                                 f_rotation=f_rotation, return_params=True)
+
+    # Check the recorded offsets are the offsets post rotation, matching single spectra
+    for ind, ap in enumerate(aps):
+        _, exp_ys, exp_sp = gen_power_spectrum([1, 50], ap, pes, nlv=0,
+                                               f_rotation=f_rotation, return_params=True)
+        assert np.allclose(ys[ind, :], exp_ys)
+        assert sim_params[ind] == exp_sp
+
+    # Check the recorded parameters can be updated
+    new_sp = update_sim_ap_params(sim_params[0], 0.5, 'exponent')
+    assert new_sp.aperiodic_params[1] == 1.5
+
+def test_gen_group_power_spectra_mixed_params():
+
+    n_spectra = 3
+
+    aps = [[1, 1], [1, 10, 1.5], [0.5, 2]]
+    pes = [[], [10, 0.5, 1], [[10, 0.5, 1], [20, 0.25, 2]]]
+
+    xs, ys = gen_group_power_spectra(n_spectra, [3, 50], aps, pes, nlvs=0)
+
+    for ind in range(n_spectra):
+        assert np.allclose(ys[ind, :], gen_power_vals(xs, aps[ind], check_flat(pes[ind]), 0))
+
+def test_gen_group_power_spectra_param_iter():
+
+    exps = [1, 1.5]
+    aps = param_iter([1, Stepper(1, 2, 0.5)])
+
+    xs, ys, sim_params = gen_group_power_spectra(2, [3, 50], aps, [10, 0.5, 1], nlvs=0,
+                                                 return_params=True)
+
+    for ind, exp in enumerate(exps):
+        assert np.allclose(ys[ind, :], gen_power_vals(xs, [1, exp], [10, 0.5, 1], 0))
+        assert sim_params[ind].aperiodic_params == (1, exp)
+
+def test_gen_group_power_spectra_seed():
+
+    set_random_seed(21)
+    _, ys1 = gen_group_power_spectra(3, *default_group_params(), nlvs=0.1)
+    set_random_seed(21)
+    _, ys2 = gen_group_power_spectra(3, *default_group_params(), nlvs=0.1)
+
+    assert array_equal(ys1, ys2)
+
+    # Check simulating in parallel gives the same spectra
+    set_random_seed(21)
+    _, ys3 = gen_group_power_spectra(3, *default_group_params(), nlvs=0.1, n_jobs=2)
+
+    assert array_equal(ys1, ys3)
+
+@pytest.mark.parametrize('backend', [
+    'numpy',
+    pytest.param('numba', marks=pytest.mark.skipif(
+        not sim_gen.numba, reason='Numba not available: skipping test.'))])
+def test_gen_power_vals_stacked(backend, monkeypatch):
+
+    if backend == 'numpy':
+        monkeypatch.setattr(sim_gen, 'numba', False)
+
+    aps = [[1, 1], [1, 10, 1.5]]
+    pes = [[10.2, 0.5, 1], [[10, 0.5, 1], [20, 0.25, 2]]]
+
+    # Check the backend matches computing the components per spectrum
+    #   This is checked for evenly, and unevenly, spaced frequencies, with and without noise
+    for xs in [gen_freqs([3, 50], 0.5), np.logspace(0.5, 1.7, 50)]:
+        for noise in [np.random.normal(0, 0.1, [2, len(xs)]), None]:
+            ys = sim_gen._gen_power_vals_stacked(
+                xs, sim_gen._stack_ap_params(aps), sim_gen._stack_pe_params(pes), noise)
+            for ind in range(2):
+                exp_ys = gen_aperiodic(xs, aps[ind]) + gen_periodic(xs, check_flat(pes[ind]))
+                if noise is not None:
+                    exp_ys = exp_ys + noise[ind, :]
+                assert np.allclose(ys[ind, :], 10**exp_ys)
+
+def test_gen_power_vals_batch():
+
+    xs = gen_freqs([3, 50], 0.5)
+    aps = [[1, 1], [1, 10, 1.5]]
+    pes = [[[10, 0.5, 1], [np.nan] * 3], [[10, 0.5, 1], [20, 0.25, 2]]]
+
+    # Check fixed and knee definitions, with a NaN knee as no knee, and NaN peaks as padding
+    for ap_arr in [[aps[0], aps[0]], [[1, np.nan, 1], aps[1]]]:
+        ys = gen_power_vals_batch(xs, ap_arr, pes, 0)
+        assert ys.shape == (2, len(xs))
+        for ind in range(2):
+            exp_ap = ap_arr[ind][0::2] if np.isnan(ap_arr[ind][1]) else ap_arr[ind]
+            exp_pe = check_flat([pe for pe in pes[ind] if not np.isnan(pe[0])])
+            assert np.allclose(ys[ind, :], gen_power_vals(xs, exp_ap, exp_pe, 0))
+
+    # Check noise follows the random seed, including across jobs
+    set_random_seed(21)
+    ys1 = gen_power_vals_batch(xs, [aps[0], aps[0]], pes, [0.1, 0.2])
+    set_random_seed(21)
+    ys2 = gen_power_vals_batch(xs, [aps[0], aps[0]], pes, [0.1, 0.2], n_jobs=2)
+    assert array_equal(ys1, ys2)
+
+    # Check spectra without any peaks, and invalid aperiodic definitions
+    ys = gen_power_vals_batch(xs, [[0, 2], [0, 1]], [[], []], 0)
+    assert np.allclose(ys[1, :], gen_power_vals(xs, [0, 1], [], 0))
+    with raises(ValueError):
+        gen_power_vals_batch(xs, [1, 1], [[]], 0)
+
+def test_check_even_spacing():
+
+    assert sim_gen._check_even_spacing(gen_freqs([3, 50], 0.5))
+    assert sim_gen._check_even_spacing(gen_freqs([1, 100], 0.1))
+    assert not sim_gen._check_even_spacing(np.logspace(0.5, 1.7, 50))
+    assert not sim_gen._check_even_spacing(np.array([10.]))
+
+def test_pow10_options():
+
+    vals = np.array([-2, 0.5, 3])
+    for ufunc, scale in sim_gen._POW10_OPTIONS.values():
+        assert np.allclose(ufunc(scale * vals), 10**vals)
+
 def test_gen_aperiodic():
 
     xs = gen_freqs([3, 50], 0.5)
@@ -151,6 +316,18 @@ def test_gen_power_values():
 
     assert np.all(ys)
 
+    # Check power values can be stored into a given array
+    out = np.zeros(len(xs))
+    ys = gen_power_vals(xs, ap_params, pe_params, nlv, out=out)
+    assert ys is out
+    assert np.all(out)
+
+    # Check that without noise, power values are the combination of the components
+    for ap_params in [[50, 2], [50, 10, 2]]:
+        ys = gen_power_vals(xs, ap_params, pe_params, 0)
+        exp_ys = 10**(gen_aperiodic(xs, ap_params) + gen_periodic(xs, pe_params))
+        assert np.allclose(ys, exp_ys)
+
 def test_gen_rotated_power_vals():
 
     xs = gen_freqs([3, 50], 0.5)
@@ -164,6 +341,13 @@ def test_gen_rotated_power_vals():
 
     assert np.all(ys)
 
+    # Check rotated spectra with a knee raise an error, including within a group
+    with raises(ValueError):
+        gen_rotated_power_vals(xs, [50, 1, 2], pe_params, nlv, f_rotation)
+    with raises(ValueError):
+        gen_group_power_spectra(2, [3, 50], [[None, 1], [50, 1, 2]], pe_params,
+                                f_rotation=f_rotation)
+
 def test_gen_model():
 
     xs = gen_freqs([3, 50], 0.5)
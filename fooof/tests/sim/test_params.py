@@ -2,6 +2,7 @@
 
 from py.test import raises
 
+import numpy as np
 from numpy import array_equal
 
 from fooof.core.errors import InconsistentDataError
@@ -28,21 +29,67 @@ def test_collect_sim_params():
     sp = collect_sim_params(ap, pe, nlv)
     assert array_equal(sp.periodic_params, [[10, 1, 1], [20, 1, 1]])
 
+    # Check parameters are stored as tuples, separate from the inputs
+    ap = [1, 1]
+    sp = collect_sim_params(ap, pe, nlv)
+    ap[0] = 2
+    assert sp.aperiodic_params == (1, 1)
+    assert sp.periodic_params == ((10, 1, 1), (20, 1, 1))
+
+def test_collect_group_sim_params():
+
+    aps = [[1, 1], [1, 10, 2]]
+    pes = [[20, 1, 1, 10, 1, 1], []]
+    nlvs = [0.05, 0]
+
+    sps = collect_group_sim_params(aps, pes, nlvs)
+    assert isinstance(sps, GroupSimParams)
+    assert len(sps) == 2
+
+    # Check stored arrays are padded with NaN, and that peaks are sorted
+    assert np.isnan(sps.aperiodic_params[0, 1])
+    assert np.all(np.isnan(sps.periodic_params[1]))
+    assert array_equal(sps.periodic_params[0], [[10, 1, 1], [20, 1, 1]])
+
+    # Check indexing matches collecting parameters per spectrum
+    for sp, ap, pe, nlv in zip(sps, aps, pes, nlvs):
+        assert sp == collect_sim_params(ap, pe, nlv)
+    assert sps[-1] == sps[1]
+    assert sps[0:1] == [sps[0]]
+
+    # Check offsets are kept, even if not defined, and only the knee marks the 'fixed' mode
+    sps = collect_group_sim_params([[None, 1], [np.nan, 1, 1]], pes, nlvs)
+    assert len(sps[0].aperiodic_params) == 2
+    assert np.isnan(sps[0].aperiodic_params[0])
+    assert len(sps[1].aperiodic_params) == 3
+
+    # Check comparing to a list of SimParams objects
+    sps = collect_group_sim_params(aps, pes, nlvs)
+    assert sps == [collect_sim_params(ap, pe, nlv) for ap, pe, nlv in zip(aps, pes, nlvs)]
+    assert sps != sps[:1]
+
+    # Check spectra without parameter definitions are returned as None
+    sps = collect_group_sim_params(aps, pes, nlvs, n_spectra=3)
+    assert len(sps) == 3
+    assert sps[2] is None
+    with raises(IndexError):
+        sps[3]
+
 def test_update_sim_ap_params():
 
     sim_params = SimParams([1, 1], [10, 1, 1], 0.05)
 
     # Check updating of a single specified parameter
     new_sim_params = update_sim_ap_params(sim_params, 1, 'exponent')
-    assert new_sim_params.aperiodic_params == [1, 2]
+    assert new_sim_params.aperiodic_params == (1, 2)
 
     # Check updating of multiple specified parameters
     new_sim_params = update_sim_ap_params(sim_params, [1, 1], ['offset', 'exponent'])
-    assert new_sim_params.aperiodic_params == [2, 2]
+    assert new_sim_params.aperiodic_params == (2, 2)
 
     # Check updating of all parameters
     new_sim_params = update_sim_ap_params(sim_params, [1, 1])
-    assert new_sim_params.aperiodic_params == [2, 2]
+    assert new_sim_params.aperiodic_params == (2, 2)
 
     # Check error with invalid overwrite
     with raises(InconsistentDataError):
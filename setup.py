@@ -57,6 +57,7 @@ setup(
     extras_require = {
         'plot'    : ['matplotlib'],
         'tests'   : ['pytest'],
-        'all'     : ['matplotlib', 'tqdm', 'pytest']
+        'numba'   : ['numba'],
+        'all'     : ['matplotlib', 'tqdm', 'pytest', 'numba']
     }
 )